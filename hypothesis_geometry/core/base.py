@@ -1,12 +1,11 @@
 from functools import partial
-from itertools import (chain,
-                       cycle,
-                       repeat)
-from operator import add
+from itertools import chain
+from operator import is_not
 from typing import (Callable,
                     List,
                     Optional,
                     Sequence,
+                    Sized,
                     Tuple,
                     Type)
 
@@ -28,14 +27,19 @@ from ground.hints import (Box,
 from hypothesis import strategies
 
 from .constants import (MIN_CONTOUR_SIZE,
-                        MinContourSize)
-from .contracts import (are_segments_non_crossing_non_overlapping,
+                        MinContourSize,
+                        MixComponent)
+from .contracts import (ExtremeSegmentsTracker,
+                        are_segments_non_crossing_non_overlapping,
                         are_vertices_non_convex,
-                        are_vertices_strict,
-                        has_horizontal_lowermost_segment,
-                        has_valid_size,
-                        has_vertical_leftmost_segment,
-                        multicontour_has_valid_sizes)
+                        has_horizontal_lowermost_edge,
+                        has_vertical_leftmost_edge,
+                        is_segment_horizontal,
+                        is_segment_vertical,
+                        multicontour_has_valid_sizes,
+                        segment_to_max_x,
+                        segment_to_min_y,
+                        to_size_checker)
 from .factories import (contour_vertices_to_edges,
                         to_convex_vertices_sequence,
                         to_max_convex_hull,
@@ -48,9 +52,9 @@ from .hints import (Chooser,
                     Multicontour,
                     Orienteer,
                     Strategy)
-from .utils import (cut,
-                    pack,
+from .utils import (pack,
                     pairwise,
+                    permute,
                     sort_pair,
                     to_next_prime,
                     to_prior_prime)
@@ -60,20 +64,23 @@ def to_boxes(x_coordinates: Strategy[Scalar],
              y_coordinates: Optional[Strategy[Scalar]],
              *,
              context: Context) -> Strategy[Box[Scalar]]:
-    return (strategies.builds(add,
-                              strategies.lists(x_coordinates,
-                                               min_size=2,
-                                               max_size=2,
-                                               unique=True)
-                              .map(sort_pair),
-                              strategies.lists(x_coordinates
-                                               if y_coordinates is None
-                                               else y_coordinates,
-                                               min_size=2,
-                                               max_size=2,
-                                               unique=True)
-                              .map(sort_pair))
-            .map(pack(context.box_cls)))
+    def to_box(xs: Sequence[Scalar],
+               ys: Sequence[Scalar],
+               box_cls: Type[Box] = context.box_cls) -> Box[Scalar]:
+        (min_x, max_x), (min_y, max_y) = sort_pair(xs), sort_pair(ys)
+        return box_cls(min_x, max_x, min_y, max_y)
+
+    return strategies.builds(to_box,
+                             strategies.lists(x_coordinates,
+                                              min_size=2,
+                                              max_size=2,
+                                              unique=True),
+                             strategies.lists(x_coordinates
+                                              if y_coordinates is None
+                                              else y_coordinates,
+                                              min_size=2,
+                                              max_size=2,
+                                              unique=True))
 
 
 def to_choosers() -> Strategy[Chooser]:
@@ -116,9 +123,8 @@ def to_convex_vertices_sequences(x_coordinates: Strategy[Scalar],
                                         context=context
                                 ),
                                 strategies.randoms(use_true_random=True))
-              .filter(partial(has_valid_size,
-                              min_size=min_size,
-                              max_size=max_size)))
+              .filter(to_size_checker(min_size=min_size,
+                                      max_size=max_size)))
     result = (to_rectangular_vertices_sequences(x_coordinates, y_coordinates,
                                                 context=context)
               | result
@@ -158,170 +164,133 @@ def to_mixes(x_coordinates: Strategy[Scalar],
                                                 * min_polygon_hole_size))
     min_polygons_points_count = min_polygons_size * min_polygon_points_count
     min_segments_points_count = 2 * min_segments_size
-    min_points_count = (min_points_size + min_segments_points_count
+    min_non_polygons_points_count = (min_points_size
+                                     + min_segments_points_count)
+    min_points_count = (min_non_polygons_points_count
                         + min_polygons_points_count)
+    max_segments_points_count_bound = (None
+                                       if max_segments_size is None
+                                       else 2 * max_segments_size)
+    is_component_touchable = (False, True, True)
     empty = context.empty
     mix_cls = context.mix_cls
     multipoint_cls = context.multipoint_cls
     multipolygon_cls = context.multipolygon_cls
     multisegment_cls = context.multisegment_cls
 
-    @strategies.composite
-    def xs_to_mix(draw: Callable[[Strategy[Domain]], Domain],
-                  xs: List[Scalar]) -> Mix:
-        (
-            points_counts, segments_endpoints_counts, polygons_vertices_counts
-        ) = to_points_counts(draw, len(xs))
-        xs = sorted(xs)
-        points, segments, polygons = [], [], []
-
-        def draw_points(points_count: int) -> None:
-            points.extend(draw(
-                    to_unique_points_sequences(
-                            strategies.sampled_from(xs[:points_count]),
-                            y_coordinates,
-                            min_size=points_count,
-                            max_size=points_count,
-                            context=context
-                    )
-            ))
-
-        def draw_segments(points_count: int) -> None:
-            size = points_count // 2
-            segments.extend(draw(
-                    to_non_crossing_non_overlapping_segments_sequences(
-                            strategies.sampled_from(xs[:points_count]),
-                            y_coordinates,
-                            min_size=size,
-                            max_size=size,
-                            context=context
-                    )
-            ))
+    def to_points_strategy(x_coordinates: Strategy[Scalar],
+                           y_coordinates: Strategy[Scalar],
+                           points_count: int
+                           ) -> Strategy[Sequence[Point[Scalar]]]:
+        return to_unique_points_sequences(x_coordinates, y_coordinates,
+                                          min_size=points_count,
+                                          max_size=points_count,
+                                          context=context)
 
-        def draw_polygon(points_count: int) -> None:
-            polygon_x_coordinates = strategies.sampled_from(
-                    xs[:to_prior_prime(points_count)]
-            )
-            polygons.append(draw(
-                    to_polygons(polygon_x_coordinates,
-                                y_coordinates,
-                                min_size=min_polygon_border_size,
-                                max_size=max_polygon_border_size,
-                                min_holes_size=min_polygon_holes_size,
-                                max_holes_size=max_polygon_holes_size,
-                                min_hole_size=min_polygon_hole_size,
-                                max_hole_size=max_polygon_hole_size,
-                                context=context)
-            ))
+    def to_segments_strategy(x_coordinates: Strategy[Scalar],
+                             y_coordinates: Strategy[Scalar],
+                             points_count: int
+                             ) -> Strategy[Sequence[Segment[Scalar]]]:
+        size = points_count // 2
+        return to_non_crossing_non_overlapping_segments_sequences(
+                x_coordinates, y_coordinates,
+                min_size=size,
+                max_size=size,
+                context=context
+        )
 
-        drawers_with_points_counts = draw(strategies.permutations(
-                tuple(chain(zip(repeat(draw_points), points_counts),
-                            zip(repeat(draw_segments),
-                                segments_endpoints_counts),
-                            zip(repeat(draw_polygon),
-                                polygons_vertices_counts)))
-        ))
-        to_contour_segments = context.contour_segments
-        for index, (drawer, count) in enumerate(drawers_with_points_counts):
-            drawer(count)
-            can_touch_next_geometry = (
-                    (index < len(drawers_with_points_counts) - 1
-                     and (drawers_with_points_counts[index + 1][0]
-                          is not draw_points))
-                    and (drawer is draw_segments
-                         and index < len(drawers_with_points_counts) - 1
-                         and (drawers_with_points_counts[index + 1]
-                              is not draw_points)
-                         and not has_vertical_leftmost_segment(segments)
-                         or drawer is draw_polygon
-                         and index < len(drawers_with_points_counts) - 1
-                         and (drawers_with_points_counts[index + 1]
-                              is not draw_points)
-                         and
-                         not has_vertical_leftmost_segment(
-                                 to_contour_segments(polygons[-1].border)
-                         ))
-            )
-            xs = xs[count - can_touch_next_geometry:]
-        return mix_cls(unpack_points(points), unpack_segments(segments),
-                       unpack_polygons(polygons))
+    def to_polygon_strategy(x_coordinates: Strategy[Scalar],
+                            y_coordinates: Strategy[Scalar],
+                            _points_count: int) -> Strategy[Polygon[Scalar]]:
+        return to_polygons(x_coordinates, y_coordinates,
+                           min_size=min_polygon_border_size,
+                           max_size=max_polygon_border_size,
+                           min_holes_size=min_polygon_holes_size,
+                           max_holes_size=max_polygon_holes_size,
+                           min_hole_size=min_polygon_hole_size,
+                           max_hole_size=max_polygon_hole_size,
+                           context=context)
+
+    components_factories = (to_points_strategy, to_segments_strategy,
+                            to_polygon_strategy)
 
     @strategies.composite
-    def ys_to_mix(draw: Callable[[Strategy[Domain]], Domain],
-                  ys: List[Scalar]) -> Mix:
+    def coordinates_to_mix(draw: Callable[[Strategy[Domain]], Domain],
+                           coordinates: List[Scalar],
+                           horizontal: bool) -> Mix:
         (
             points_counts, segments_endpoints_counts, polygons_vertices_counts
-        ) = to_points_counts(draw, len(ys))
-        ys = sorted(ys)
+        ) = to_points_counts(draw, len(coordinates))
+        coordinates.sort()
+        offset = 0
         points, segments, polygons = [], [], []
+        extreme_segments_tracker, has_touching_edge = (
+            (ExtremeSegmentsTracker(segment_to_max_x, is_segment_vertical),
+             has_vertical_leftmost_edge)
+            if horizontal
+            else (ExtremeSegmentsTracker(segment_to_min_y,
+                                         is_segment_horizontal),
+                  has_horizontal_lowermost_edge)
+        )
 
-        def draw_points(points_count: int) -> None:
-            points.extend(draw(
-                    to_unique_points_sequences(
-                            x_coordinates,
-                            strategies.sampled_from(ys[:points_count]),
-                            min_size=points_count,
-                            max_size=points_count,
-                            context=context
-                    )
-            ))
+        def to_coordinates_strategies(size: int
+                                      ) -> Tuple[Strategy[Scalar],
+                                                 Strategy[Scalar]]:
+            sampler = (strategies.integers(offset, offset + size - 1)
+                       .map(coordinates.__getitem__))
+            return ((sampler, y_coordinates)
+                    if horizontal
+                    else (x_coordinates, sampler))
+
+        def to_component_strategy(kind: MixComponent,
+                                  points_count: int) -> Strategy[Domain]:
+            coordinates_count = (to_prior_prime(points_count)
+                                 if kind is MixComponent.POLYGON
+                                 else points_count)
+            return components_factories[kind](
+                    *to_coordinates_strategies(coordinates_count),
+                    points_count
+            )
 
-        def draw_segments(points_count: int) -> None:
-            size = points_count // 2
-            segments.extend(draw(
-                    to_non_crossing_non_overlapping_segments_sequences(
-                            x_coordinates,
-                            strategies.sampled_from(ys[:points_count]),
-                            min_size=size,
-                            max_size=size,
-                            context=context
-                    )
-            ))
+        def draw_points(points_count: int) -> bool:
+            points.extend(draw(to_component_strategy(MixComponent.POINTS,
+                                                     points_count)))
+            return False
 
-        def draw_polygon(points_count: int) -> None:
-            polygons.append(draw(
-                    to_polygons(x_coordinates,
-                                strategies.sampled_from(ys[:points_count]),
-                                min_size=min_polygon_border_size,
-                                max_size=max_polygon_border_size,
-                                min_holes_size=min_polygon_holes_size,
-                                max_holes_size=max_polygon_holes_size,
-                                min_hole_size=min_polygon_hole_size,
-                                max_hole_size=max_polygon_hole_size,
-                                context=context)
+        def draw_segments(points_count: int) -> bool:
+            drawn_segments = draw(to_component_strategy(
+                    MixComponent.SEGMENTS, points_count
             ))
-
-        drawers_with_points_counts = draw(
-                strategies.permutations(
-                        tuple(chain(zip(repeat(draw_points), points_counts),
-                                    zip(repeat(draw_segments),
-                                        segments_endpoints_counts),
-                                    zip(repeat(draw_polygon),
-                                        polygons_vertices_counts)))
-                )
-        )
-        to_contour_segments = context.contour_segments
-        for index, (drawer, count) in enumerate(drawers_with_points_counts):
-            drawer(count)
+            segments.extend(drawn_segments)
+            extreme_segments_tracker.update(drawn_segments)
+            return not extreme_segments_tracker.is_satisfied
+
+        def draw_polygon(points_count: int) -> bool:
+            polygon = draw(to_component_strategy(MixComponent.POLYGON,
+                                                 points_count))
+            polygons.append(polygon)
+            return not has_touching_edge(polygon.border.vertices)
+
+        drawers = draw_points, draw_segments, draw_polygon
+        kinds_with_points_counts = draw(strategies.permutations(
+                [(kind, count)
+                 for kind, counts in [
+                     (MixComponent.POINTS, points_counts),
+                     (MixComponent.SEGMENTS, segments_endpoints_counts),
+                     (MixComponent.POLYGON, polygons_vertices_counts)
+                 ]
+                 for count in counts]
+        ))
+        last_index = len(kinds_with_points_counts) - 1
+        for index, (kind, count) in enumerate(kinds_with_points_counts):
             can_touch_next_geometry = (
-                    (index < len(drawers_with_points_counts) - 1
-                     and (drawers_with_points_counts[index + 1][0]
-                          is not draw_points))
-                    and (drawer is draw_segments
-                         and index < len(drawers_with_points_counts) - 1
-                         and (drawers_with_points_counts[index + 1]
-                              is not draw_points)
-                         and not has_horizontal_lowermost_segment(segments)
-                         or drawer is draw_polygon
-                         and index < len(drawers_with_points_counts) - 1
-                         and (drawers_with_points_counts[index + 1]
-                              is not draw_points)
-                         and
-                         not has_horizontal_lowermost_segment(
-                                 to_contour_segments(polygons[-1].border)
-                         ))
+                    drawers[kind](count)
+                    and index < last_index
+                    and is_component_touchable[
+                        kinds_with_points_counts[index + 1][0]
+                    ]
             )
-            ys = ys[count - can_touch_next_geometry:]
+            offset += count - can_touch_next_geometry
         return mix_cls(unpack_points(points), unpack_segments(segments),
                        unpack_polygons(polygons))
 
@@ -345,39 +314,47 @@ def to_mixes(x_coordinates: Strategy[Scalar],
     def to_points_counts(draw: Callable[[Strategy[Domain]], Domain],
                          max_points_count: int
                          ) -> Tuple[List[int], List[int], List[int]]:
-        max_polygons_points_count = (max_points_count - min_points_size
-                                     - min_segments_points_count)
-        polygons_size_upper_bound = (max_polygons_points_count
-                                     // min_polygon_points_count)
-        polygons_size = draw(strategies.integers(
-                min_polygons_size,
-                polygons_size_upper_bound
-                if max_polygons_size is None
-                else min(polygons_size_upper_bound, max_polygons_size)))
-        max_polygon_points_count = (to_prior_prime(max_polygons_points_count
-                                                   // polygons_size)
-                                    if polygons_size
-                                    else 0)
-        polygons_points_counts = (
-            [draw(polygons_points_counts)
-             for polygons_points_counts in repeat(
-                    strategies.integers(min_polygon_points_count,
-                                        max_polygon_points_count),
-                    polygons_size)]
-            if polygons_size
-            else [])
+        if max_polygons_size == 0:
+            polygons_points_counts = []
+        else:
+            max_polygons_points_count = (max_points_count
+                                         - min_non_polygons_points_count)
+            polygons_size_upper_bound = (max_polygons_points_count
+                                         // min_polygon_points_count)
+            polygons_size = draw(strategies.integers(
+                    min_polygons_size,
+                    polygons_size_upper_bound
+                    if max_polygons_size is None
+                    else min(polygons_size_upper_bound, max_polygons_size)))
+            max_polygon_points_count = (
+                to_prior_prime(max_polygons_points_count // polygons_size)
+                if polygons_size
+                else 0
+            )
+            polygons_points_counts = (
+                draw(strategies.lists(
+                        strategies.integers(min_polygon_points_count,
+                                            max_polygon_points_count),
+                        min_size=polygons_size,
+                        max_size=polygons_size
+                ))
+                if polygons_size
+                else [])
         polygons_points_count = sum(polygons_points_counts)
-        segments_endpoints_count_upper_bound = (max_points_count
-                                                - polygons_points_count
-                                                - min_points_size)
-        max_segments_points_count = (
-            segments_endpoints_count_upper_bound
-            if max_segments_size is None
-            else min(segments_endpoints_count_upper_bound,
-                     2 * max_segments_size))
-        segments_points_count = draw(strategies.sampled_from(
-                range(min_segments_points_count,
-                      max_segments_points_count + 1, 2)))
+        if max_segments_size == 0:
+            segments_points_count = 0
+        else:
+            segments_endpoints_count_upper_bound = (max_points_count
+                                                    - polygons_points_count
+                                                    - min_points_size)
+            max_segments_points_count = (
+                segments_endpoints_count_upper_bound
+                if max_segments_points_count_bound is None
+                else min(segments_endpoints_count_upper_bound,
+                         max_segments_points_count_bound))
+            segments_points_count = draw(strategies.sampled_from(
+                    range(min_segments_points_count,
+                          max_segments_points_count + 1, 2)))
         points_size_upper_bound = (max_points_count - segments_points_count
                                    - polygons_points_count)
         points_size = (points_size_upper_bound
@@ -391,21 +368,34 @@ def to_mixes(x_coordinates: Strategy[Scalar],
     def partition(draw: Callable[[Strategy[Domain]], Domain],
                   value: int) -> List[int]:
         assert value >= 0, 'Value should be non-negative.'
-        result = []
-        while value:
-            part = draw(strategies.integers(1, value))
-            result.append(part)
-            value -= part
-        return result
-
-    return ((strategies.lists(x_coordinates,
-                              min_size=min_points_count,
-                              unique=True)
-             .flatmap(xs_to_mix))
+        if not value:
+            return []
+        parts_count = draw(strategies.integers(1, value))
+        if parts_count == 1:
+            return [value]
+        cuts = sorted(draw(strategies.lists(
+                strategies.sampled_from(range(1, value)),
+                min_size=parts_count - 1,
+                max_size=parts_count - 1,
+                unique=True
+        )))
+        return [end - start
+                for start, end in pairwise(chain((0,), cuts, (value,)))]
+
+    x_coordinates_lists = strategies.lists(x_coordinates,
+                                           min_size=min_points_count,
+                                           unique=True)
+    if y_coordinates is x_coordinates:
+        return (strategies.tuples(x_coordinates_lists, strategies.booleans())
+                .flatmap(pack(coordinates_to_mix)))
+    return ((x_coordinates_lists
+             .flatmap(partial(coordinates_to_mix,
+                              horizontal=True)))
             | (strategies.lists(y_coordinates,
                                 min_size=min_points_count,
                                 unique=True)
-               .flatmap(ys_to_mix)))
+               .flatmap(partial(coordinates_to_mix,
+                                horizontal=False))))
 
 
 def to_multicontours(x_coordinates: Strategy[Scalar],
@@ -419,7 +409,7 @@ def to_multicontours(x_coordinates: Strategy[Scalar],
     def points_to_multicontours(points: List[Point]) -> Strategy[Multicontour]:
         return strategies.builds(partial(to_multicontour, points,
                                          context=context),
-                                 to_sizes(len(points)), to_choosers())
+                                 to_sizes(len(points)), choosers)
 
     def to_sizes(limit: int) -> Strategy[List[int]]:
         size_upper_bound = limit // min_contour_size
@@ -434,30 +424,41 @@ def to_multicontours(x_coordinates: Strategy[Scalar],
     def _to_sizes(size: int,
                   min_element_size: int,
                   limit: int) -> Strategy[List[int]]:
-        max_sizes = [min_element_size] * size
-        indices = cycle(range(size))
-        for _ in range(limit - size * min_element_size):
-            max_sizes[next(indices)] += 1
-        sizes_ranges = [range(min_element_size, max_element_size + 1)
-                        for max_element_size in max_sizes]
-        return (strategies.tuples(*[strategies.sampled_from(sizes_range)
-                                    for sizes_range in sizes_ranges])
-                .flatmap(strategies.permutations))
+        if not size:
+            return strategies.builds(list)
+        extra_size, extra_remainder = divmod(limit - size * min_element_size,
+                                             size)
+        max_element_size = min_element_size + extra_size
+        if (max_contour_size is not None
+                and max_element_size >= max_contour_size):
+            max_element_size, extra_remainder = max_contour_size, 0
+        sizes_ranges = [range(min_element_size,
+                              max_element_size + (index < extra_remainder) + 1)
+                        for index in range(size)]
+        return strategies.builds(
+                permute,
+                strategies.tuples(*[strategies.sampled_from(sizes_range)
+                                    for sizes_range in sizes_ranges]),
+                strategies.permutations(range(size))
+        )
 
+    choosers = to_choosers()
     min_points_count = min_size * min_contour_size
     max_points_count = (None
                         if max_size is None or max_contour_size is None
                         else max_size * max_contour_size)
-    return (to_points_in_general_position(x_coordinates, y_coordinates,
-                                          min_size=min_points_count,
-                                          max_size=max_points_count,
-                                          context=context)
-            .flatmap(points_to_multicontours)
-            .filter(partial(multicontour_has_valid_sizes,
-                            min_size=min_size,
-                            max_size=max_size,
-                            min_contour_size=min_contour_size,
-                            max_contour_size=max_contour_size)))
+    result = (to_points_in_general_position(x_coordinates, y_coordinates,
+                                            min_size=min_points_count,
+                                            max_size=max_points_count,
+                                            context=context)
+              .flatmap(points_to_multicontours))
+    return (result.filter(partial(multicontour_has_valid_sizes,
+                                  min_size=min_size,
+                                  max_size=max_size,
+                                  min_contour_size=min_contour_size,
+                                  max_contour_size=max_contour_size))
+            if min_size or min_contour_size > MIN_CONTOUR_SIZE
+            else result)
 
 
 def to_multipoints(x_coordinates: Strategy[Scalar],
@@ -489,6 +490,14 @@ def to_multipolygons(x_coordinates: Strategy[Scalar],
         y_coordinates = x_coordinates
     min_polygon_points_count = to_next_prime(min_border_size
                                              + min_holes_size * min_hole_size)
+    to_polygons_strategy = partial(to_polygons,
+                                   min_size=min_border_size,
+                                   max_size=max_border_size,
+                                   min_holes_size=min_holes_size,
+                                   max_holes_size=max_holes_size,
+                                   min_hole_size=min_hole_size,
+                                   max_hole_size=max_hole_size,
+                                   context=context)
 
     @strategies.composite
     def xs_to_polygons(draw: Callable[[Strategy[Domain]], Domain],
@@ -498,8 +507,7 @@ def to_multipolygons(x_coordinates: Strategy[Scalar],
                                         size_upper_bound
                                         if max_size is None
                                         else min(max_size, size_upper_bound)))
-        xs = sorted(xs)
-        to_contour_segments = context.contour_segments
+        xs.sort()
         result = []
         start, coordinates_count = 0, len(xs)
         for index in range(size - 1):
@@ -509,29 +517,17 @@ def to_multipolygons(x_coordinates: Strategy[Scalar],
                                         // (size - index))
             )
             polygon_xs = xs[start:start + to_prior_prime(polygon_points_count)]
-            polygon = draw(to_polygons(strategies.sampled_from(polygon_xs),
-                                       y_coordinates,
-                                       min_size=min_border_size,
-                                       max_size=max_border_size,
-                                       min_holes_size=min_holes_size,
-                                       max_holes_size=max_holes_size,
-                                       min_hole_size=min_hole_size,
-                                       max_hole_size=max_hole_size,
-                                       context=context))
+            polygon = draw(to_polygons_strategy(
+                    strategies.sampled_from(polygon_xs), y_coordinates
+            ))
             result.append(polygon)
-            can_touch_next_polygon = not has_vertical_leftmost_segment(
-                    to_contour_segments(polygon.border)
+            can_touch_next_polygon = not has_vertical_leftmost_edge(
+                    polygon.border.vertices
             )
             start += polygon_points_count - can_touch_next_polygon
-        result.append(draw(to_polygons(strategies.sampled_from(xs[start:]),
-                                       y_coordinates,
-                                       min_size=min_border_size,
-                                       max_size=max_border_size,
-                                       min_holes_size=min_holes_size,
-                                       max_holes_size=max_holes_size,
-                                       min_hole_size=min_hole_size,
-                                       max_hole_size=max_hole_size,
-                                       context=context)))
+        result.append(draw(to_polygons_strategy(
+                strategies.sampled_from(xs[start:]), y_coordinates
+        )))
         return result
 
     @strategies.composite
@@ -542,8 +538,7 @@ def to_multipolygons(x_coordinates: Strategy[Scalar],
                                         size_upper_bound
                                         if max_size is None
                                         else min(max_size, size_upper_bound)))
-        ys = sorted(ys)
-        to_contour_segments = context.contour_segments
+        ys.sort()
         result = []
         start, coordinates_count = 0, len(ys)
         for index in range(size - 1):
@@ -553,38 +548,44 @@ def to_multipolygons(x_coordinates: Strategy[Scalar],
                                         // (size - index))
             )
             polygon_ys = ys[start:start + to_prior_prime(polygon_points_count)]
-            polygon = draw(to_polygons(x_coordinates,
-                                       strategies.sampled_from(polygon_ys),
-                                       min_size=min_border_size,
-                                       max_size=max_border_size,
-                                       min_holes_size=min_holes_size,
-                                       max_holes_size=max_holes_size,
-                                       min_hole_size=min_hole_size,
-                                       max_hole_size=max_hole_size,
-                                       context=context))
+            polygon = draw(to_polygons_strategy(
+                    x_coordinates, strategies.sampled_from(polygon_ys)
+            ))
             result.append(polygon)
-            can_touch_next_polygon = not has_horizontal_lowermost_segment(
-                    to_contour_segments(polygon.border))
+            can_touch_next_polygon = not has_horizontal_lowermost_edge(
+                    polygon.border.vertices
+            )
             start += polygon_points_count - can_touch_next_polygon
-        result.append(draw(to_polygons(x_coordinates,
-                                       strategies.sampled_from(ys[start:]),
-                                       min_size=min_border_size,
-                                       max_size=max_border_size,
-                                       min_holes_size=min_holes_size,
-                                       max_holes_size=max_holes_size,
-                                       min_hole_size=min_hole_size,
-                                       max_hole_size=max_hole_size,
-                                       context=context)))
+        result.append(draw(to_polygons_strategy(
+                x_coordinates, strategies.sampled_from(ys[start:])
+        )))
         return result
 
+    if not min_holes_size:
+        def multicontour_to_polygons(multicontour: Multicontour[Scalar],
+                                     polygon_cls: Type[Polygon]
+                                     = context.polygon_cls
+                                     ) -> Sequence[Polygon[Scalar]]:
+            return [polygon_cls(contour, []) for contour in multicontour]
+
+        hole_less_polygons = (to_multicontours(x_coordinates, y_coordinates,
+                                               min_size=min_size,
+                                               max_size=max_size,
+                                               min_contour_size
+                                               =min_border_size,
+                                               max_contour_size
+                                               =max_border_size,
+                                               context=context)
+                              .map(multicontour_to_polygons))
+        if max_holes_size == 0:
+            return hole_less_polygons.map(context.multipolygon_cls)
     min_points_count = min_size * min_polygon_points_count
+    max_polygon_points_count = _to_polygon_max_points_count(
+            max_border_size, max_holes_size, max_hole_size
+    )
     max_points_count = (None
-                        if (max_size is None
-                            or max_border_size is None
-                            or max_holes_size is None
-                            or max_hole_size is None)
-                        else max(max_size * (max_border_size
-                                             + max_hole_size * max_holes_size),
+                        if max_size is None or max_polygon_points_count is None
+                        else max(max_size * max_polygon_points_count,
                                  min_points_count))
     polygons = ((strategies.lists(x_coordinates,
                                   min_size=min_points_count,
@@ -597,20 +598,7 @@ def to_multipolygons(x_coordinates: Strategy[Scalar],
                                     unique=True)
                    .flatmap(ys_to_polygons)))
     if not min_holes_size:
-        def multicontour_to_polygons(multicontour: Multicontour[Scalar],
-                                     polygon_cls: Type[Polygon]
-                                     = context.polygon_cls
-                                     ) -> Sequence[Polygon[Scalar]]:
-            return [polygon_cls(contour, []) for contour in multicontour]
-
-        polygons = ((to_multicontours(x_coordinates, y_coordinates,
-                                      min_size=min_size,
-                                      max_size=max_size,
-                                      min_contour_size=min_border_size,
-                                      max_contour_size=max_border_size,
-                                      context=context)
-                     .map(multicontour_to_polygons))
-                    | polygons)
+        polygons = hole_less_polygons | polygons
     return polygons.map(context.multipolygon_cls)
 
 
@@ -649,13 +637,17 @@ def to_non_crossing_non_overlapping_segments_sequences(
 
     def to_vertical_multisegment(x: Scalar,
                                  ys: List[Scalar]) -> Sequence[Segment]:
-        return [segment_cls(point_cls(x, y), point_cls(x, next_y))
-                for y, next_y in pairwise(sorted(ys))]
+        ys.sort()
+        return to_chain_segments([point_cls(x, y) for y in ys])
 
     def to_horizontal_multisegment(xs: List[Scalar],
                                    y: Scalar) -> Sequence[Segment]:
-        return [segment_cls(point_cls(x, y), point_cls(next_x, y))
-                for x, next_x in pairwise(sorted(xs))]
+        xs.sort()
+        return to_chain_segments([point_cls(x, y) for x in xs])
+
+    def to_chain_segments(points: Sequence[Point]) -> Sequence[Segment]:
+        return [segment_cls(start, end)
+                for start, end in zip(points, points[1:])]
 
     next_min_size, next_max_size = (min_size + 1, (max_size
                                                    if max_size is None
@@ -770,26 +762,26 @@ def to_polygons(x_coordinates: Strategy[Scalar],
                 min_hole_size: int,
                 max_hole_size: Optional[int],
                 context: Context) -> Strategy[Polygon[Scalar]]:
-    def points_to_polygons(points: Sequence[Point[Scalar]]
-                           ) -> Strategy[Polygon[Scalar]]:
+    @strategies.composite
+    def to_unchecked_polygons(draw: Callable[[Strategy[Domain]], Domain]
+                              ) -> Polygon[Scalar]:
+        points, convex_hull_size, max_convex_hull_size = draw(
+                points_with_convex_hulls_sizes
+        )
         max_border_points_count = len(points) - min_inner_points_count
-        min_border_size = max(min_size,
-                              len(context.points_convex_hull(points)))
+        min_border_size = max(min_size, convex_hull_size)
         max_border_size = (max_border_points_count
                            if max_size is None
                            else min(max_size, max_border_points_count))
-        return strategies.builds(partial(to_polygon, points,
-                                         context=context),
-                                 strategies.integers(min_border_size,
-                                                     max_border_size),
-                                 to_holes_sizes(points),
-                                 to_choosers())
-
-    def to_holes_sizes(points: Sequence[Point]) -> Strategy[List[int]]:
-        max_inner_points_count = (
-                len(points)
-                - len(to_max_convex_hull(points, context.angle_orientation))
-        )
+        border_size = draw(strategies.integers(min_border_size,
+                                               max_border_size))
+        holes_sizes = draw(to_holes_sizes(len(points)
+                                          - max_convex_hull_size))
+        chooser = draw(choosers)
+        return to_polygon(points, border_size, holes_sizes, chooser, context)
+
+    def to_holes_sizes(max_inner_points_count: int
+                       ) -> Strategy[Sequence[int]]:
         holes_size_scale = max_inner_points_count // min_hole_size
         points_max_hole_size = (holes_size_scale
                                 if max_holes_size is None
@@ -804,25 +796,35 @@ def to_polygons(x_coordinates: Strategy[Scalar],
 
     def _to_holes_sizes(holes_size: int,
                         min_hole_points_count: int,
-                        max_hole_points_count: int) -> Strategy[List[int]]:
+                        max_hole_points_count: int
+                        ) -> Strategy[Sequence[int]]:
         if not holes_size:
             return strategies.builds(list)
-        max_holes_points_counts = [min_hole_points_count] * holes_size
-        indices = cycle(range(holes_size))
-        for _ in range(max_hole_points_count
-                       - holes_size * min_hole_points_count):
-            max_holes_points_counts[next(indices)] += 1
-        sizes_ranges = [range(min_hole_points_count, max_hole_points_count + 1)
-                        for max_hole_points_count in max_holes_points_counts]
-        return (strategies.permutations([strategies.sampled_from(sizes_range)
-                                         for sizes_range in sizes_ranges])
-                .flatmap(pack(strategies.tuples))
-                .map(list))
-
-    def has_valid_sizes(polygon: Polygon) -> bool:
-        return (has_valid_size(polygon.border.vertices,
-                               min_size=min_size,
-                               max_size=max_size)
+        extra_points_count, extra_remainder = divmod(
+                max_hole_points_count - holes_size * min_hole_points_count,
+                holes_size
+        )
+        max_single_hole_points_count = (min_hole_points_count
+                                        + extra_points_count)
+        if (max_hole_size is not None
+                and max_single_hole_points_count >= max_hole_size):
+            max_single_hole_points_count, extra_remainder = max_hole_size, 0
+        sizes_ranges = [range(min_hole_points_count,
+                              max_single_hole_points_count
+                              + (index < extra_remainder) + 1)
+                        for index in range(holes_size)]
+        return strategies.builds(
+                permute,
+                strategies.tuples(*[strategies.sampled_from(sizes_range)
+                                    for sizes_range in sizes_ranges]),
+                strategies.permutations(range(holes_size))
+        )
+
+    def has_valid_sizes(polygon: Polygon,
+                        has_valid_border_size: Callable[[Sized], bool]
+                        = to_size_checker(min_size=min_size,
+                                          max_size=max_size)) -> bool:
+        return (has_valid_border_size(polygon.border.vertices)
                 and multicontour_has_valid_sizes(
                         polygon.holes,
                         min_size=min_holes_size,
@@ -833,26 +835,38 @@ def to_polygons(x_coordinates: Strategy[Scalar],
 
     min_inner_points_count = min_hole_size * min_holes_size
 
-    def has_valid_inner_points_count(points: Sequence[Point]) -> bool:
-        return ((max_size is None
-                 or len(context.points_convex_hull(points)) <= max_size)
-                and (len(points)
-                     - len(to_max_convex_hull(points,
-                                              context.angle_orientation))
+    def to_points_with_convex_hulls_sizes(
+            points: Sequence[Point],
+            points_convex_hull: Callable[[Sequence[Point]], Sequence[Point]]
+            = context.points_convex_hull,
+            orienteer: Orienteer = context.angle_orientation
+    ) -> Tuple[Sequence[Point], int, int]:
+        return (points, len(points_convex_hull(points)),
+                len(to_max_convex_hull(points, orienteer)))
+
+    def has_valid_inner_points_count(
+            points_with_convex_hulls_sizes: Tuple[Sequence[Point], int, int]
+    ) -> bool:
+        points, convex_hull_size, max_convex_hull_size = (
+            points_with_convex_hulls_sizes
+        )
+        return ((max_size is None or convex_hull_size <= max_size)
+                and (len(points) - max_convex_hull_size
                      >= min_inner_points_count))
 
     min_points_count = min_size + min_inner_points_count
-    max_points_count = (None
-                        if (max_size is None or max_holes_size is None
-                            or max_hole_size is None)
-                        else max_size + max_hole_size * max_holes_size)
-    return (to_points_in_general_position(x_coordinates, y_coordinates,
-                                          min_size=min_points_count,
-                                          max_size=max_points_count,
-                                          context=context)
-            .filter(has_valid_inner_points_count)
-            .flatmap(points_to_polygons)
-            .filter(has_valid_sizes))
+    max_points_count = _to_polygon_max_points_count(max_size, max_holes_size,
+                                                    max_hole_size)
+    points_with_convex_hulls_sizes = (
+        to_points_in_general_position(x_coordinates, y_coordinates,
+                                      min_size=min_points_count,
+                                      max_size=max_points_count,
+                                      context=context)
+        .map(to_points_with_convex_hulls_sizes)
+        .filter(has_valid_inner_points_count)
+    )
+    choosers = to_choosers()
+    return to_unchecked_polygons().filter(has_valid_sizes)
 
 
 def to_rectangular_vertices_sequences(x_coordinates: Strategy[Scalar],
@@ -876,15 +890,13 @@ def to_segments(x_coordinates: Strategy[Scalar],
                 y_coordinates: Optional[Strategy[Scalar]],
                 *,
                 context: Context) -> Strategy[Segment[Scalar]]:
-    def non_degenerate_endpoints(endpoints: Tuple[Point, Point]) -> bool:
-        start, end = endpoints
-        return start != end
+    def is_non_degenerate(segment: Segment) -> bool:
+        return segment.start != segment.end
 
     points = to_points(x_coordinates, y_coordinates,
                        context=context)
-    return (strategies.tuples(points, points)
-            .filter(non_degenerate_endpoints)
-            .map(pack(context.segment_cls)))
+    return (strategies.builds(context.segment_cls, points, points)
+            .filter(is_non_degenerate))
 
 
 def to_star_vertices_sequences(x_coordinates: Strategy[Scalar],
@@ -900,17 +912,23 @@ def to_star_vertices_sequences(x_coordinates: Strategy[Scalar],
                                           context=context)
             .map(partial(to_star_contour_vertices,
                          context=context))
-            .filter(partial(has_valid_size,
-                            min_size=min_size,
-                            max_size=max_size)))
+            .filter(to_size_checker(min_size=min_size,
+                                    max_size=max_size)))
 
 
-def to_sub_lists(values: Sequence[Domain],
+@strategies.composite
+def to_sub_lists(draw: Callable[[Strategy[Domain]], Domain],
+                 values: Sequence[Domain],
                  *,
-                 min_size: int) -> Strategy[List[Domain]]:
-    return strategies.builds(cut,
-                             strategies.permutations(values),
-                             strategies.integers(min_size, len(values)))
+                 min_size: int) -> List[Domain]:
+    size = draw(strategies.integers(min_size, len(values)))
+    result = list(values)
+    max_index = len(result) - 1
+    for index in range(min(size, max_index)):
+        swap_index = draw(strategies.integers(index, max_index))
+        result[index], result[swap_index] = result[swap_index], result[index]
+    del result[size:]
+    return result
 
 
 def to_triangular_vertices_sequences(x_coordinates: Strategy[Scalar],
@@ -918,22 +936,23 @@ def to_triangular_vertices_sequences(x_coordinates: Strategy[Scalar],
                                      *,
                                      context: Context
                                      ) -> Strategy[Sequence[Point[Scalar]]]:
-    def to_counterclockwise_vertices(vertices_triplet
-                                     : Tuple[Point, Point, Point],
-                                     orienteer: Orienteer
-                                     = context.angle_orientation
-                                     ) -> Tuple[Point, Point, Point]:
-        return (vertices_triplet
-                if orienteer(*vertices_triplet) is Orientation.COUNTERCLOCKWISE
-                else vertices_triplet[::-1])
+    def to_strict_counterclockwise_vertices(
+            vertices_triplet: Tuple[Point, Point, Point],
+            orienteer: Orienteer = context.angle_orientation
+    ) -> Optional[Sequence[Point]]:
+        orientation = orienteer(*vertices_triplet)
+        if orientation is Orientation.COLLINEAR:
+            return None
+        result = list(vertices_triplet)
+        if orientation is not Orientation.COUNTERCLOCKWISE:
+            result.reverse()
+        return result
 
     vertices = to_points(x_coordinates, y_coordinates,
                          context=context)
     return (strategies.tuples(vertices, vertices, vertices)
-            .filter(partial(are_vertices_strict,
-                            orienteer=context.angle_orientation))
-            .map(to_counterclockwise_vertices)
-            .map(list))
+            .map(to_strict_counterclockwise_vertices)
+            .filter(partial(is_not, None)))
 
 
 def to_unique_points_sequences(x_coordinates: Strategy[Scalar],
@@ -995,6 +1014,15 @@ def _to_vertices_sequences(
                .flatmap(to_points_with_sizes)
                .map(pack(partial(to_vertices_sequence,
                                  context=context)))
-               .filter(partial(has_valid_size,
-                               min_size=min_size,
-                               max_size=max_size))))
+               .filter(to_size_checker(min_size=min_size,
+                                       max_size=max_size))))
+
+
+def _to_polygon_max_points_count(max_border_size: Optional[int],
+                                 max_holes_size: Optional[int],
+                                 max_hole_size: Optional[int]
+                                 ) -> Optional[int]:
+    return (None
+            if (max_border_size is None or max_holes_size is None
+                or max_hole_size is None)
+            else max_border_size + max_hole_size * max_holes_size)
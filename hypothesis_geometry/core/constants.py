@@ -8,7 +8,15 @@ class MinContourSize(IntEnum):
     CONVEX = 3
 
 
+@unique
+class MixComponent(IntEnum):
+    POINTS = 0
+    SEGMENTS = 1
+    POLYGON = 2
+
+
 MIN_CONTOUR_SIZE = min(MinContourSize)
 MIN_MULTIPOINT_SIZE = 1
 MIN_MULTICONTOUR_SIZE = MIN_MULTIPOLYGON_SIZE = MIN_MULTISEGMENT_SIZE = 2
 MIN_MIX_COMPONENTS_COUNT = 2
+MAX_PAIRWISE_CHECKED_SEGMENTS_COUNT = 12
@@ -1,23 +1,33 @@
-from typing import (Iterable,
+from itertools import combinations
+from typing import (Callable,
+                    Iterable,
                     Optional,
                     Sequence,
                     Sized)
 
 from bentley_ottmann.planar import segments_cross_or_overlap
 from ground.base import (Context,
-                         Orientation)
+                         Orientation,
+                         Relation)
 from ground.hints import (Point,
                           Scalar,
                           Segment)
+from reprit.base import generate_repr
 
+from .constants import MAX_PAIRWISE_CHECKED_SEGMENTS_COUNT
 from .hints import (Multicontour,
                     Orienteer)
 
 
 def are_segments_non_crossing_non_overlapping(segments: Sequence[Segment],
                                               context: Context) -> bool:
-    return not segments_cross_or_overlap(segments,
-                                         context=context)
+    if len(segments) > MAX_PAIRWISE_CHECKED_SEGMENTS_COUNT:
+        return not segments_cross_or_overlap(segments,
+                                             context=context)
+    segments_relation = context.segments_relation
+    return all(segments_relation(segment, other_segment)
+               in (Relation.DISJOINT, Relation.TOUCH)
+               for segment, other_segment in combinations(segments, 2))
 
 
 def has_valid_size(sized: Sized,
@@ -28,24 +38,78 @@ def has_valid_size(sized: Sized,
     return min_size <= size and (max_size is None or size <= max_size)
 
 
+def to_size_checker(*,
+                    min_size: int,
+                    max_size: Optional[int]) -> Callable[[Sized], bool]:
+    if max_size is None:
+        def is_valid_size(sized: Sized) -> bool:
+            return min_size <= len(sized)
+    else:
+        def is_valid_size(sized: Sized) -> bool:
+            return min_size <= len(sized) <= max_size
+    return is_valid_size
+
+
 def has_horizontal_lowermost_segment(segments: Sequence[Segment]) -> bool:
-    lowermost_segment = max(segments,
-                            key=segment_to_min_y)
-    min_y = segment_to_min_y(lowermost_segment)
-    return (is_segment_horizontal(lowermost_segment)
-            or any(segment_to_min_y(segment) == min_y
-                   and is_segment_horizontal(segment)
-                   for segment in segments))
+    tracker = ExtremeSegmentsTracker(segment_to_min_y, is_segment_horizontal)
+    tracker.update(segments)
+    return tracker.is_satisfied
 
 
 def has_vertical_leftmost_segment(segments: Sequence[Segment]) -> bool:
-    leftmost_segment = max(segments,
-                           key=segment_to_max_x)
-    max_x = segment_to_max_x(leftmost_segment)
-    return (is_segment_vertical(leftmost_segment)
-            or any(segment_to_max_x(segment) == max_x
-                   and is_segment_vertical(segment)
-                   for segment in segments))
+    tracker = ExtremeSegmentsTracker(segment_to_max_x, is_segment_vertical)
+    tracker.update(segments)
+    return tracker.is_satisfied
+
+
+def has_horizontal_lowermost_edge(vertices: Sequence[Point]) -> bool:
+    return _has_extreme_axis_aligned_edge([vertex.y for vertex in vertices])
+
+
+def has_vertical_leftmost_edge(vertices: Sequence[Point]) -> bool:
+    return _has_extreme_axis_aligned_edge([vertex.x for vertex in vertices])
+
+
+def _has_extreme_axis_aligned_edge(coordinates: Sequence[Scalar]) -> bool:
+    extremum, result = None, False
+    for start, end in zip(coordinates, coordinates[1:] + coordinates[:1]):
+        value = start if start < end else end
+        if extremum is None or value > extremum:
+            extremum, result = value, start == end
+        elif value == extremum and not result:
+            result = start == end
+    return result
+
+
+class ExtremeSegmentsTracker:
+    """
+    Incrementally checks if any of segments with maximum key
+    satisfies given predicate.
+    """
+    __slots__ = '_extremum', '_is_satisfied', 'key', 'predicate'
+
+    def __init__(self,
+                 key: Callable[[Segment[Scalar]], Scalar],
+                 predicate: Callable[[Segment[Scalar]], bool]) -> None:
+        self.key, self.predicate = key, predicate
+        self._extremum, self._is_satisfied = None, False
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def is_satisfied(self) -> bool:
+        """Checks if any of extreme segments satisfies the predicate."""
+        return self._is_satisfied
+
+    def update(self, segments: Iterable[Segment[Scalar]]) -> None:
+        """Takes given segments into account."""
+        for segment in segments:
+            value = self.key(segment)
+            if self._extremum is None or value > self._extremum:
+                self._extremum, self._is_satisfied = (value,
+                                                      self.predicate(segment))
+            elif value == self._extremum and not self._is_satisfied:
+                self._is_satisfied = self.predicate(segment)
 
 
 def is_segment_horizontal(segment: Segment) -> bool:
@@ -62,13 +126,17 @@ def multicontour_has_valid_sizes(multicontour: Multicontour,
                                  max_size: Optional[int],
                                  min_contour_size: int,
                                  max_contour_size: Optional[int]) -> bool:
-    return (has_valid_size(multicontour,
-                           min_size=min_size,
-                           max_size=max_size)
-            and all(has_valid_size(contour.vertices,
-                                   min_size=min_contour_size,
-                                   max_size=max_contour_size)
-                    for contour in multicontour))
+    if not has_valid_size(multicontour,
+                          min_size=min_size,
+                          max_size=max_size):
+        return False
+    for contour in multicontour:
+        contour_size = len(contour.vertices)
+        if (contour_size < min_contour_size
+                or (max_contour_size is not None
+                    and contour_size > max_contour_size)):
+            return False
+    return True
 
 
 def segment_to_max_x(segment: Segment[Scalar]) -> Scalar:
@@ -29,7 +29,9 @@ from locus import segmental
 
 from .constants import MIN_CONTOUR_SIZE
 from .contracts import (angle_contains_point,
+                        has_horizontal_lowermost_edge,
                         has_horizontal_lowermost_segment,
+                        has_vertical_leftmost_edge,
                         has_vertical_leftmost_segment)
 from .hints import (Chooser,
                     Multicontour,
@@ -38,6 +40,8 @@ from .subdivisional import (QuadEdge,
                             to_edge_neighbours)
 from .triangular import (Triangulation,
                          to_boundary_edges)
+from .utils import (horizontal_point_key,
+                    vertical_point_key)
 
 
 def to_multicontour(points: Sequence[Point[Scalar]],
@@ -48,31 +52,29 @@ def to_multicontour(points: Sequence[Point[Scalar]],
                                             vertical_point_key])
     points = list(points)
     prior_sorting_key = predicate = None
-    contour_cls, to_contour_segments = (context.contour_cls,
-                                        context.contour_segments)
+    contour_cls = context.contour_cls
     result = []
     for size in sizes:
         sorting_key = sorting_key_chooser()
         if sorting_key is not prior_sorting_key:
             prior_sorting_key, predicate = (
                 sorting_key,
-                has_vertical_leftmost_segment
+                has_vertical_leftmost_edge
                 if sorting_key is horizontal_point_key
-                else has_horizontal_lowermost_segment
+                else has_horizontal_lowermost_edge
             )
             points.sort(key=sorting_key)
         contour_vertices = to_vertices_sequence(points[:size], size, context)
         if len(contour_vertices) >= MIN_CONTOUR_SIZE:
-            contour = contour_cls(contour_vertices)
-            result.append(contour)
-            can_touch_next_contour = predicate(to_contour_segments(contour))
+            result.append(contour_cls(contour_vertices))
+            can_touch_next_contour = predicate(contour_vertices)
             points = points[size - can_touch_next_contour:]
     return result
 
 
 def to_polygon(points: Sequence[Point[Scalar]],
                border_size: int,
-               holes_sizes: List[int],
+               holes_sizes: Sequence[int],
                chooser: Chooser,
                context: Context) -> Polygon[Scalar]:
     triangulation = Triangulation.delaunay(points, context)
@@ -127,8 +129,12 @@ def to_polygon(points: Sequence[Point[Scalar]],
                 and not cross_or_overlap_holes(segment_cls(edge.end,
                                                            neighbour_end)))
 
-    def segments_cross_or_overlap(left: Segment, right: Segment) -> bool:
-        relation = context.segments_relation(left, right)
+    def segments_cross_or_overlap(left: Segment,
+                                  right: Segment,
+                                  segments_relation: Callable[
+                                      [Segment, Segment], Relation
+                                  ] = context.segments_relation) -> bool:
+        relation = segments_relation(left, right)
         return (relation is not Relation.DISJOINT
                 or relation is not Relation.TOUCH)
 
@@ -276,7 +282,8 @@ def compress_contour(vertices: MutableSequence[Point],
 
 def to_max_convex_hull(points: Sequence[Point[Scalar]],
                        orienteer: Orienteer) -> Sequence[Point[Scalar]]:
-    points = sorted(points)
+    points = sorted(points,
+                    key=horizontal_point_key)
     lower = _to_sub_hull(points, orienteer)
     upper = _to_sub_hull(reversed(points), orienteer)
     return lower[:-1] + upper[:-1]
@@ -523,11 +530,3 @@ def _triangulation_to_border_vertices(triangulation: Triangulation
     result = [edge.start for edge in to_boundary_edges(triangulation)]
     compress_contour(result, triangulation.context.angle_orientation)
     return result
-
-
-def horizontal_point_key(point: Point[Scalar]) -> Tuple[Scalar, Scalar]:
-    return point.x, point.y
-
-
-def vertical_point_key(point: Point[Scalar]) -> Tuple[Scalar, Scalar]:
-    return point.y, point.x
@@ -17,6 +17,7 @@ from reprit.base import generate_repr
 
 from .subdivisional import QuadEdge
 from .utils import (ceil_log2,
+                    horizontal_point_key,
                     pairwise)
 
 
@@ -26,7 +27,8 @@ class Triangulation:
                  points: Sequence[Point],
                  context: Context) -> 'Triangulation':
         """Constructs Delaunay triangulation from given points."""
-        points = sorted(points)
+        points = sorted(points,
+                        key=horizontal_point_key)
         result = [cls._initialize_triangulation(points[start:stop],
                                                 context)
                   for start, stop in pairwise(accumulate(
@@ -2,9 +2,13 @@ from functools import partial
 from itertools import chain
 from typing import (Callable,
                     Iterable,
+                    List,
                     Sequence,
                     Tuple)
 
+from ground.hints import (Point,
+                          Scalar)
+
 from .hints import (Domain,
                     Range)
 
@@ -18,10 +22,6 @@ def ceil_log2(number: int) -> int:
     return number.bit_length() - (not (number & (number - 1)))
 
 
-def cut(values: Domain, limit: int) -> Domain:
-    return values[:limit] if limit < len(values) else values
-
-
 flatten = chain.from_iterable
 
 
@@ -55,6 +55,10 @@ def _is_prime(value: int) -> bool:
     return True
 
 
+def horizontal_point_key(point: Point[Scalar]) -> Tuple[Scalar, Scalar]:
+    return point.x, point.y
+
+
 def pack(function: Callable[..., Range]
          ) -> Callable[[Iterable[Domain]], Range]:
     return partial(apply, function)
@@ -68,6 +72,15 @@ def pairwise(iterable: Iterable[Domain]) -> Iterable[Tuple[Domain, Domain]]:
         element = next_element
 
 
+def permute(values: Sequence[Domain],
+            indices: Iterable[int]) -> List[Domain]:
+    return [values[index] for index in indices]
+
+
 def sort_pair(pair: Sequence[Domain]) -> Tuple[Domain, Domain]:
     first, second = pair
     return (first, second) if first < second else (second, first)
+
+
+def vertical_point_key(point: Point[Scalar]) -> Tuple[Scalar, Scalar]:
+    return point.y, point.x
@@ -1801,6 +1801,9 @@ def _validate_sizes(min_size: int,
                     min_expected_size: int,
                     min_size_name: str = 'min_size',
                     max_size_name: str = 'max_size') -> None:
+    if min_expected_size <= min_size and (max_size is None
+                                          or min_size <= max_size):
+        return
     if max_size is None:
         pass
     elif max_size < min_expected_size: